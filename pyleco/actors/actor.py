@@ -149,10 +149,9 @@ class Actor(MessageHandler, Generic[Device]):
         :param waiting_time: Timeout of the poller in ms.
         """
         socks = super()._listen_loop_element(poller, waiting_time)
-        if self.pipeL in socks:
+        if socks.pop(self.pipeL, None):
             self.pipeL.recv()
             self.readout()
-            del socks[self.pipeL]
         return socks
 
     def queue_readout(self) -> None:
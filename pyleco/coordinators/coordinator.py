@@ -35,7 +35,7 @@ if __name__ != "__main__":
     from ..utils.coordinator_utils import CommunicationError, Directory, ZmqNode, ZmqMultiSocket,\
         MultiSocket
     from ..core.message import Message, MessageTypes
-    from ..core.serialization import get_json_content_type, JsonContentTypes
+    from ..core.serialization import get_json_content_type, JsonContentTypes, serialize_data
     from ..json_utils.errors import NODE_UNKNOWN, RECEIVER_UNKNOWN
     from ..json_utils.json_objects import ErrorResponse, Request, ParamsRequest, DataError
     from ..json_utils.rpc_server import RPCServer
@@ -48,7 +48,7 @@ else:  # pragma: no cover
     from pyleco.utils.coordinator_utils import CommunicationError, Directory, ZmqNode,\
           ZmqMultiSocket, MultiSocket
     from pyleco.core.message import Message, MessageTypes
-    from pyleco.core.serialization import get_json_content_type, JsonContentTypes
+    from pyleco.core.serialization import get_json_content_type, JsonContentTypes, serialize_data
     from pyleco.json_utils.errors import NODE_UNKNOWN, RECEIVER_UNKNOWN
     from pyleco.json_utils.json_objects import ErrorResponse, Request, ParamsRequest, DataError
     from pyleco.json_utils.rpc_server import RPCServer
@@ -213,11 +213,13 @@ class Coordinator:
 
     def _clean_components(self, expiration_time: float) -> None:
         to_admonish = self.directory.find_expired_components(expiration_time=expiration_time)
+        # The request is the same for all expired components, serialize it only once.
+        data = serialize_data(Request(id=0, method="pong"))
         for identity, name in to_admonish:
             message = self.create_message(
                 receiver=b".".join((self.namespace, name)),
                 message_type=MessageTypes.JSON,
-                data=Request(id=0, method="pong"),
+                data=data,
             )
             self.sock.send_message(identity, message)
         self.publish_directory_update()
@@ -366,7 +368,7 @@ class Coordinator:
     def handle_rpc_call(self, message: Message) -> None:
         reply = self.rpc.process_request(message.payload[0])
         sender_namespace = message.sender_elements.namespace
-        log.debug(f"Reply {reply!r} to {message.sender!r} at node {sender_namespace!r}.")
+        log.debug("Reply %r to %r at node %r.", reply, message.sender, sender_namespace)
         if sender_namespace == self.namespace or sender_namespace == b"":
             self.send_main_sock_reply(
                 sender_identity=self.current_identity,
@@ -390,7 +392,8 @@ class Coordinator:
     @staticmethod
     def set_log_level(level: str) -> None:
         plevel = PythonLogLevels[level]
-        log.setLevel(plevel)
+        if log.level != plevel:
+            log.setLevel(plevel)
 
     def shut_down(self) -> None:
         self.sign_out_from_all_coordinators()
@@ -478,16 +481,18 @@ class Coordinator:
         # TODO TBD whether to send the whole directory or only a diff.
         nodes = self.directory.get_nodes_str_dict()
         components = self.directory.get_component_names()
+        # The content is the same for all nodes, serialize it only once.
+        data = serialize_data([
+            ParamsRequest(id=5, method="add_nodes", params={"nodes": nodes}).model_dump(),
+            ParamsRequest(
+                id=6, method="record_components", params={"components": components}
+            ).model_dump(),
+        ])
         for node in self.directory.get_nodes().keys():
             self.send_message(
                 receiver=b".".join((node, b"COORDINATOR")),
                 message_type=MessageTypes.JSON,
-                data=[
-                    ParamsRequest(id=5, method="add_nodes", params={"nodes": nodes}).model_dump(),
-                    ParamsRequest(
-                        id=6, method="record_components", params={"components": components}
-                    ).model_dump(),
-                ],
+                data=data,
             )
 
 
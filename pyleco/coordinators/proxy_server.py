@@ -203,10 +203,10 @@ def main(
     poller = zmq.Poller()
     poller.register(reader, zmq.POLLIN)
     while stop_event is None or not stop_event.is_set():
-        if socks := dict(poller.poll(1)):
-            if reader in socks:
-                received = reader.recv_multipart()
-                log.debug(f"Message brokered: {received}")
+        # The reader is the only registered socket, so any event belongs to it.
+        if poller.poll(1):
+            received = reader.recv_multipart()
+            log.debug("Message brokered: %s", received)
     context.term()
 
 
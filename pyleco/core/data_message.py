@@ -32,6 +32,9 @@ from .serialization import deserialize_data, generate_conversation_id, serialize
 class DataMessage:
     """A message of the data protocol."""
 
+    # Data messages are created in large numbers, therefore avoid the instance dictionary.
+    __slots__ = ("topic", "header", "payload")
+
     topic: bytes
     header: bytes
     payload: list[bytes]
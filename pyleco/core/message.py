@@ -50,7 +50,10 @@ class Message:
     All attributes, except the official frames, are for convenience.
     """
 
-    version: bytes = VERSION_B
+    # Messages are created for every request and response, therefore avoid the instance dictionary.
+    __slots__ = ("version", "receiver", "sender", "header", "payload")
+
+    version: bytes
     receiver: bytes
     sender: bytes
     header: bytes
@@ -66,6 +69,7 @@ class Message:
                  message_type: Union[MessageTypes, int] = MessageTypes.NOT_DEFINED,
                  additional_payload: Optional[Iterable[bytes]] = None,
                  ) -> None:
+        self.version = VERSION_B
         self.receiver = receiver.encode() if isinstance(receiver, str) else receiver
         self.sender = sender.encode() if isinstance(sender, str) else sender
         if header and (conversation_id or message_id or message_type != MessageTypes.NOT_DEFINED):
@@ -49,6 +49,9 @@ json_objects = (
     ParamsNotification,
 )
 
+# A single compact encoder instance avoids building a new one for every `json.dumps` call.
+_json_encoder = json.JSONEncoder(separators=(",", ":"))
+
 
 class FullName(NamedTuple):
     namespace: bytes
@@ -144,7 +147,7 @@ def serialize_data(data: Any) -> bytes:
     if isinstance(data, json_objects):
         return data.model_dump_json().encode()  # type: ignore
     else:
-        return json.dumps(data, separators=(',', ':')).encode()
+        return _json_encoder.encode(data).encode()
 
 
 def deserialize_data(content: bytes) -> Any:
@@ -89,9 +89,11 @@ class Director:
     def ask_message(self, actor: Optional[Union[bytes, str]] = None,
                     data: Optional[Any] = None, **kwargs) -> Message:
         actor = self._actor_check(actor)
-        log.debug(f"Asking {actor!r} with message '{data}'.")
+        log.debug("Asking %r with message '%s'.", actor, data)
         response = self.communicator.ask(actor, data=data, **kwargs)
-        log.debug(f"Data '{response.data}' received.")
+        if log.isEnabledFor(logging.DEBUG):
+            # Deserializing the response is expensive, do it only if necessary.
+            log.debug("Data '%s' received.", response.data)
         return response
 
     def _actor_check(self, actor: Optional[Union[bytes, str]]) -> Union[bytes, str]:
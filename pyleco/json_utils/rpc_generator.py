@@ -23,6 +23,8 @@
 #
 
 from __future__ import annotations
+from dataclasses import asdict, is_dataclass
+from functools import lru_cache
 import json
 import logging
 from typing import Any, Union
@@ -34,6 +36,28 @@ log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
 
+@lru_cache(maxsize=256)
+def _request_tail(method: str) -> str:
+    """Return the constant part of a request without params, following the id."""
+    request = Request(id=0, method=method).model_dump_json()
+    return request[request.index(","):]
+
+
+@lru_cache(maxsize=256)
+def _params_request_parts(method: str) -> tuple[str, str]:
+    """Return the constant parts of a request with params, around the params."""
+    request = ParamsRequest(id=0, method=method, params=[]).model_dump_json()
+    index = request.rindex('"params":[]')
+    return request[request.index(","):index + 9], request[index + 11:]
+
+
+def _serialize_params_default(obj: Any) -> Any:
+    """Serialize dataclasses in params in the same way as `asdict` does."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 class RPCGenerator:
     """This class can generate a JSONRPC request string and interpret the result string."""
 
@@ -47,12 +71,15 @@ class RPCGenerator:
             )
         id = self._id_counter
         self._id_counter += 1
-        r: Union[Request, ParamsRequest]
         if args or kwargs:
-            r = ParamsRequest(id=id, method=method, params=kwargs or list(args))
+            # Serialize only the params, without the deep copy of `ParamsRequest.model_dump`.
+            head, tail = _params_request_parts(method)
+            params = json.dumps(kwargs or list(args), separators=(",", ":"),
+                                default=_serialize_params_default)
+            return f'{{"id":{id}{head}{params}{tail}'
         else:
-            r = Request(id=id, method=method)
-        return r.model_dump_json()
+            # Only the id changes between requests of the same method.
+            return f'{{"id":{id}{_request_tail(method)}'
 
     def get_result_from_response(self, data: Union[bytes, str, dict]) -> Any:
         """Get the result of that object or raise an error."""
@@ -155,24 +155,47 @@ class DataLogger(ExtendedMessageHandler):
 
     # Data management
     def handle_subscription_message(self, data_message: DataMessage) -> None:
-        sender = data_message.topic.decode()
+        topic = data_message.topic
+        prefix = self._topic_prefixes.get(topic)
+        if prefix is None:
+            prefix = self._topic_prefixes[topic] = topic.decode() + "."
         try:
             content: dict[str, Any] = data_message.data  # type: ignore
-            modified_dict = {".".join((sender, k)): v for k, v in content.items()}
+            if not isinstance(content, dict):
+                raise TypeError(f"Data of type {type(content).__name__} is not a dict.")
         except Exception:
             log.exception(f"Could not decode message {data_message}.")
+            return
+        if type(self).handle_subscription_data is not DataLogger.handle_subscription_data:
+            # A subclass overrides the hook, which expects the variable names with the prefix.
+            self.handle_subscription_data({prefix + key: value for key, value in content.items()})
         else:
-            self.handle_subscription_data(modified_dict)
+            self._store_data(self._topic_tables.get(topic, {}), content, prefix=prefix)
 
     def handle_subscription_data(self, data: dict[str, Any]) -> None:
-        """Store `data` dict in `tmp`"""
+        """Store `data` dict in `tmp`.
+
+        Data protocol messages bypass this method, unless a subclass overrides it.
+        """
+        self._store_data(self.tmp, data)
+
+    def _store_data(self, table: dict[str, list[Any]], data: dict[str, Any],
+                    prefix: str = "") -> None:
+        """Append the values of `data` to the lists of `table` and check the trigger.
+
+        :param table: tmp lists by the variable name without `prefix`.
+        :param prefix: Prefix of the variable names in `data`, for example "sender name" + ".".
+        """
+        keys = data.keys()
         with self.list_lock:
-            for key, value in data.items():
-                try:
-                    self.tmp[key].append(value)
-                except KeyError:
-                    log.debug("Got value for '%s', but no list present.", key)
-        if self.trigger_type == TriggerTypes.VARIABLE and self.trigger_variable in data.keys():
+            for key in keys & table.keys():
+                table[key].append(data[key])
+        if log.isEnabledFor(logging.DEBUG):
+            for key in keys - table.keys():
+                log.debug("Got value for '%s', but no list present.", prefix + key)
+        if (self.trigger_type == TriggerTypes.VARIABLE
+                and self.trigger_variable.startswith(prefix)
+                and self.trigger_variable[len(prefix):] in data):
             self.make_datapoint()
 
     def make_datapoint(self) -> dict[str, Any]:
@@ -264,6 +287,7 @@ class DataLogger(ExtendedMessageHandler):
         self.reset_data_storage()
         subscriptions: set[str] = set()
         for variable in variables:
+            tmp: list[Any] = []
             if "." in variable:
                 # this is the new style: topic is sender name, data is in content
                 parts = variable.split(".")
@@ -274,13 +298,16 @@ class DataLogger(ExtendedMessageHandler):
                         continue
                     parts.insert(0, self.namespace)
                     variable = ".".join(parts)
-                subscriptions.add(".".join(parts[:2]))
+                topic = ".".join(parts[:2])
+                subscriptions.add(topic)
+                with self.list_lock:
+                    self._topic_tables.setdefault(topic.encode(), {})[".".join(parts[2:])] = tmp
             else:
                 # old style: topic is variable name
                 subscriptions.add(variable)
             with self.list_lock:
                 self.lists[variable] = []
-                self.tmp[variable] = []
+                self.tmp[variable] = tmp
         self.subscribe(topics=subscriptions)
 
     def reset_data_storage(self) -> None:
@@ -288,6 +315,10 @@ class DataLogger(ExtendedMessageHandler):
         with self.list_lock:
             self.tmp = {}
             self.lists = {}
+            # tmp lists of the variables of each sender, by topic and variable name
+            self._topic_tables: dict[bytes, dict[str, list[Any]]] = {}
+            # Prefix of the variable names ("sender name" + ".") for each topic, as topics repeat
+            self._topic_prefixes: dict[bytes, str] = {}
         self.last_datapoint = {}
 
     def start_timer_trigger(self, timeout: float) -> None:
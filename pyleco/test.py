@@ -63,6 +63,7 @@ class FakeSocket:
             # empirical data shots, that you have to unsubscribe as many times as you have
             # subscribed, therefore a list is best
             self._subscriptions: list[bytes] = []
+        self._options: dict[int, Any] = {}
 
     def bind(self, addr: str) -> None:
         self.addr = addr
@@ -119,6 +120,14 @@ class FakeSocket:
             except ValueError:
                 pass  # not present
 
+    def setsockopt(self, option: int, value: Any) -> None:
+        self._options[option] = value
+
+    def getsockopt(self, option: int) -> Any:
+        if option == 15:  # zmq.EVENTS
+            return 1 if len(self._r) else 0  # zmq.POLLIN
+        return self._options[option]
+
     def close(self, linger: Optional[int] = None) -> None:
         self.addr = None
         self.closed = True
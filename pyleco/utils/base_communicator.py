@@ -38,12 +38,20 @@ NOT_SIGNED_IN_ERROR_CODE = str(NOT_SIGNED_IN.code).encode()
 
 
 class MessageBuffer:
+    """Buffer messages for later retrieval.
+
+    Messages whose conversation_id is requested at the time of adding are stored by their
+    conversation_id for a fast lookup, all other ones in order of their arrival.
+    """
+
     _messages: list[Message]
+    _responses: dict[bytes, Message]
     _requested_ids: set[bytes]
 
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         self._messages = []
+        self._responses = {}
         self._requested_ids = set()
 
     def add_conversation_id(self, conversation_id: bytes) -> None:
@@ -53,6 +61,10 @@ class MessageBuffer:
     def remove_conversation_id(self, conversation_id: bytes) -> None:
         """Remove a conversation_id from the requested ids."""
         self._requested_ids.discard(conversation_id)
+        message = self._responses.pop(conversation_id, None)
+        if message is not None:
+            # Not requested anymore, it is a free message now.
+            self._messages.append(message)
 
     def is_conversation_id_requested(self, conversation_id: bytes) -> bool:
         """Check whether this conversation_id is requested by someone."""
@@ -60,10 +72,19 @@ class MessageBuffer:
 
     def add_message(self, message: Message):
         """Add a message to the buffer."""
-        self._messages.append(message)
+        cid = message.conversation_id
+        if cid in self._requested_ids and cid not in self._responses:
+            self._responses[cid] = message
+        else:
+            self._messages.append(message)
 
     def retrieve_message(self, conversation_id: Optional[bytes] = None) -> Optional[Message]:
         """Retrieve the requested message or the next free one for `conversation_id=None`."""
+        if conversation_id is not None:
+            message = self._responses.pop(conversation_id, None)
+            if message is not None:
+                self._requested_ids.discard(conversation_id)
+                return message
         for i, msg in enumerate(self._messages):
             cid = msg.conversation_id
             if conversation_id == cid:
@@ -74,7 +95,7 @@ class MessageBuffer:
         return None
 
     def __len__(self):
-        return len(self._messages)
+        return len(self._messages) + len(self._responses)
 
 
 class BaseCommunicator(CommunicatorProtocol, Protocol):
@@ -104,13 +125,15 @@ class BaseCommunicator(CommunicatorProtocol, Protocol):
 
     # Base communication
     def _send_socket_message(self, message: Message) -> None:
-        self.socket.send_multipart(message.to_frames())
+        # pyzmq copies frames below zmq.COPY_THRESHOLD anyway and sends larger ones without a copy.
+        self.socket.send_multipart(message.to_frames(), copy=False)
 
     def send_message(self, message: Message) -> None:
         """Send a message, supplying sender information."""
         if not message.sender:
             message.sender = self.full_name.encode()
-        self.log.debug(f"Sending {message}")
+        # Lazy formatting: the representation of a message with a large payload is expensive.
+        self.log.debug("Sending %s", message)
         self._send_socket_message(message=message)
 
     def sign_in(self) -> None:
@@ -47,8 +47,6 @@ class DataPublisher:
     Quantities may be expressed as a (magnitude number, units str) tuple.
     """
 
-    full_name: str
-
     def __init__(
         self,
         full_name: str,
@@ -69,6 +67,16 @@ class DataPublisher:
         self.full_name = full_name
         super().__init__(**kwargs)
 
+    @property
+    def full_name(self) -> str:
+        return self._full_name
+
+    @full_name.setter
+    def full_name(self, value: str) -> None:
+        self._full_name = value
+        # The name is the default topic of every message, encode it only once.
+        self._full_name_bytes = value.encode()
+
     def __del__(self) -> None:
         self.close()
 
@@ -87,7 +95,8 @@ class DataPublisher:
 
     def send_message(self, message: DataMessage) -> None:
         """Send a data protocol message."""
-        self.socket.send_multipart(message.to_frames())
+        # Large frames (above zmq.COPY_THRESHOLD) are handed to libzmq without a copy.
+        self.socket.send_multipart(message.to_frames(), copy=False)
 
     def send_data(
         self,
@@ -99,7 +108,7 @@ class DataPublisher:
     ) -> None:
         """Send the `data` via the data protocol."""
         message = DataMessage(
-            topic=topic or self.full_name,
+            topic=topic or self._full_name_bytes,
             data=data,
             conversation_id=conversation_id,
             message_type=message_type,
@@ -27,6 +27,8 @@ from typing import Protocol
 
 class Event(Protocol):
     """Check compatibility with threading.Event."""
+    __slots__ = ()
+
     def is_set(self) -> bool: ...  # pragma: no cover
 
     def set(self) -> None: ...  # pragma: no cover
@@ -34,6 +36,8 @@ class Event(Protocol):
 
 class SimpleEvent(Event):
     """A simple Event if the one from `threading` module is not necessary."""
+    __slots__ = ("_flag",)
+
     def __init__(self) -> None:
         self._flag = False
 
@@ -25,7 +25,7 @@
 from __future__ import annotations
 import json
 import pickle
-from typing import Optional
+from typing import Any, Callable, Optional
 
 import zmq
 
@@ -36,7 +36,18 @@ from ..core.internal_protocols import SubscriberProtocol
 
 
 class ExtendedMessageHandler(MessageHandler, SubscriberProtocol):
-    """Message handler, which handles also data protocol messages."""
+    """Message handler, which handles also data protocol messages.
+
+    :param str data_host: Host name of the proxy server to subscribe to. Defaults to `host`.
+    :param int data_port: Port number of the proxy server to subscribe to.
+    :param int data_rcvhwm: Receiving high water mark of the subscriber socket, i.e. how many
+        data messages may be queued before further ones are dropped.
+    :param int io_threads: Number of zmq I/O threads, if the global context is created by this
+        handler. A handler with a lot of traffic on both sockets may benefit from 2 to 4 threads.
+    """
+
+    # Deserialization methods of the legacy message types.
+    _legacy_loaders: dict[int, Callable[[bytes], Any]] = {234: pickle.loads, 235: json.loads}
 
     def __init__(self,
                  name: str,
@@ -44,12 +55,17 @@ class ExtendedMessageHandler(MessageHandler, SubscriberProtocol):
                  host: str = "localhost",
                  data_host: Optional[str] = None,
                  data_port: int = PROXY_SENDING_PORT,
+                 data_rcvhwm: int = 1000,
+                 io_threads: int = 1,
                  **kwargs) -> None:
         if context is None:
-            context = zmq.Context.instance()
+            # `io_threads` only takes effect, if the global instance does not exist yet.
+            context = zmq.Context.instance(io_threads=io_threads)
         super().__init__(name=name, context=context, host=host, **kwargs)
-        self._subscriptions: list[bytes] = []  # List of all subscriptions
+        self._subscriptions: set[bytes] = set()  # Set of all subscriptions
         self.subscriber: zmq.Socket = context.socket(zmq.SUB)
+        # has to be set before connecting
+        self.subscriber.setsockopt(zmq.RCVHWM, data_rcvhwm)
         if data_host is None:
             data_host = host
         self.subscriber.connect(f"tcp://{data_host}:{data_port}")
@@ -72,9 +88,8 @@ class ExtendedMessageHandler(MessageHandler, SubscriberProtocol):
     def _listen_loop_element(self, poller: zmq.Poller, waiting_time: Optional[int]
                              ) -> dict[zmq.Socket, int]:
         socks = super()._listen_loop_element(poller=poller, waiting_time=waiting_time)
-        if self.subscriber in socks:
-            self.read_subscription_message()
-            del socks[self.subscriber]
+        if socks.pop(self.subscriber, None):
+            self._handle_queued_messages(self.subscriber, self.read_subscription_message)
         return socks
 
     def read_subscription_message(self) -> None:
@@ -96,12 +111,10 @@ class ExtendedMessageHandler(MessageHandler, SubscriberProtocol):
 
     def handle_full_legacy_subscription_message(self, message: DataMessage) -> None:
         """Handle an illegal subscription message (topic is variable name)."""
-        if message.message_type == 234:
-            value = pickle.loads(message.payload[0])
-        elif message.message_type == 235:
-            value = json.loads(message.payload[0])
-        else:
+        loader = self._legacy_loaders.get(message.message_type)
+        if loader is None:
             raise ValueError("Legacy long message cannot be handled")
+        value = loader(message.payload[0])
         self.handle_subscription_data({message.topic.decode(): value})
 
     def handle_subscription_data(self, data: dict) -> None:
@@ -110,17 +123,16 @@ class ExtendedMessageHandler(MessageHandler, SubscriberProtocol):
 
     def subscribe_single(self, topic: bytes) -> None:
         if topic not in self._subscriptions:
-            self.log.debug(f"Subscribing to {topic!r}.")
-            self._subscriptions.append(topic)
+            self.log.debug("Subscribing to %r.", topic)
+            self._subscriptions.add(topic)
             self.subscriber.subscribe(topic)
         else:
-            self.log.info(f"Already subscribed to {topic!r}.")
+            self.log.info("Already subscribed to %r.", topic)
 
     def unsubscribe_single(self, topic: bytes) -> None:
-        self.log.debug(f"Unsubscribing from {topic!r}.")
+        self.log.debug("Unsubscribing from %r.", topic)
         self.subscriber.unsubscribe(topic)
-        if topic in self._subscriptions:
-            self._subscriptions.remove(topic)
+        self._subscriptions.discard(topic)
 
     def unsubscribe_all(self) -> None:
         """Unsubscribe from all subscriptions."""
@@ -25,7 +25,6 @@
 from __future__ import annotations
 import logging
 from threading import Thread, Event
-from time import sleep
 from typing import Any, Callable, Optional, Union
 
 from ..core import PROXY_SENDING_PORT, COORDINATOR_PORT
@@ -54,10 +53,13 @@ class Listener:
     :param name: Name to listen under for control commands.
     :param int data_port: Port number for the data protocol.
     :param logger: Logger instance whose logs should be published. Defaults to "__main__".
+    :param int data_rcvhwm: Receiving high water mark of the data protocol subscriber socket.
+    :param int io_threads: Number of zmq I/O threads, if the global context is created by the
+        message handler.
     """
 
     communicator: CommunicatorPipe
-    message_handler: PipeHandler
+    _message_handler: PipeHandler
 
     def __init__(self,
                  name: str,
@@ -67,6 +69,8 @@ class Listener:
                  data_port: int = PROXY_SENDING_PORT,
                  logger: Optional[logging.Logger] = None,
                  timeout: float = 1,
+                 data_rcvhwm: int = 1000,
+                 io_threads: int = 1,
                  **kwargs) -> None:
         super().__init__(**kwargs)
         log.info(f"Start Listener for '{name}'.")
@@ -74,9 +78,12 @@ class Listener:
         self.name = name
         self.logger = logger
         self.timeout = timeout
+        self.data_rcvhwm = data_rcvhwm
+        self.io_threads = io_threads
 
         self.coordinator_address = host, port
         self.data_address = data_host or host, data_port
+        self._handler_ready = Event()
 
     def close(self) -> None:
         """Close everything."""
@@ -97,11 +104,22 @@ class Listener:
         except AttributeError:
             pass
 
+    @property
+    def message_handler(self) -> PipeHandler:
+        return self._message_handler
+
+    @message_handler.setter
+    def message_handler(self, value: PipeHandler) -> None:
+        self._message_handler = value
+        # Any way of creating the message handler in the thread signals `start_listen`.
+        self._handler_ready.set()
+
     # Methods to control the Listener
     def start_listen(self) -> None:
         """Start to listen in a thread."""
         self.stop_listen()
         self.stop_event = Event()
+        self._handler_ready = Event()
         self.thread = Thread(
             target=self._listen,
             args=(
@@ -114,19 +132,13 @@ class Listener:
             ))
         self.thread.daemon = True
         self.thread.start()
-        for _ in range(10):
-            sleep(0.05)
-            try:
-                self.communicator: CommunicatorPipe = self.message_handler.get_communicator(
-                    timeout=self.timeout)
-            except AttributeError:
-                pass
-            else:
-                log.addHandler(self.message_handler.log_handler)
-                if self.logger is not None:
-                    self.logger.addHandler(self.message_handler.log_handler)
-                return
-        raise TimeoutError("PipeHandler has not started after 0.5 s.")
+        if not self._handler_ready.wait(self.timeout):
+            raise TimeoutError(f"PipeHandler has not started after {self.timeout} s.")
+        self.communicator: CommunicatorPipe = self.message_handler.get_communicator(
+            timeout=self.timeout)
+        log.addHandler(self.message_handler.log_handler)
+        if self.logger is not None:
+            self.logger.addHandler(self.message_handler.log_handler)
 
     def get_communicator(self, **kwargs) -> CommunicatorPipe:
         """Get the communicator for the calling thread, creating one if necessary."""
@@ -178,7 +190,23 @@ class Listener:
 
     def _listen(self, name: str, stop_event: Event, coordinator_host: str, coordinator_port: int,
                 data_host: str, data_port: int) -> None:
-        """Start a PipeHandler, which has to be executed in a separate thread."""
-        self.message_handler = PipeHandler(name, host=coordinator_host, port=coordinator_port,
-                                           data_host=data_host, data_port=data_port)
+        """Start a PipeHandler, which has to be executed in a separate thread.
+
+        Override :meth:`_create_message_handler` to use another message handler.
+        """
+        self.message_handler = self._create_message_handler(
+            name=name,
+            coordinator_host=coordinator_host,
+            coordinator_port=coordinator_port,
+            data_host=data_host,
+            data_port=data_port,
+        )
         self.message_handler.listen(stop_event=stop_event)
+
+    def _create_message_handler(self, name: str, coordinator_host: str, coordinator_port: int,
+                                data_host: str, data_port: int) -> PipeHandler:
+        """Create the message handler in the listening thread."""
+        return PipeHandler(name, host=coordinator_host, port=coordinator_port,
+                           data_host=data_host, data_port=data_port,
+                           data_rcvhwm=self.data_rcvhwm,
+                           io_threads=self.io_threads)
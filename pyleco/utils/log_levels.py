@@ -22,6 +22,7 @@
 # THE SOFTWARE.
 #
 
+from __future__ import annotations
 from enum import IntEnum
 import logging
 
@@ -37,7 +38,14 @@ class PythonLogLevels(IntEnum):
     CRITICAL = logging.CRITICAL
 
 
+_leco_log_levels: dict[int, LogLevels] = {
+    level.value: LogLevels[level.name] for level in PythonLogLevels
+}
+
+
 def get_leco_log_level(log_level: int) -> LogLevels:
     """Get the LECO log level from an integer (or python log level) if possible."""
-    name = PythonLogLevels(log_level).name
-    return LogLevels[name]
+    try:
+        return _leco_log_levels[log_level]
+    except KeyError:
+        raise ValueError(f"{log_level!r} is not a valid PythonLogLevels") from None
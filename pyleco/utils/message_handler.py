@@ -27,7 +27,7 @@ from functools import wraps
 from json import JSONDecodeError
 import logging
 import time
-from typing import Any, Callable, Optional, Union, TypeVar
+from typing import Any, Callable, Optional, Union, TypeVar, cast
 
 import zmq
 
@@ -73,6 +73,9 @@ class MessageHandler(BaseCommunicator, ExtendedComponentProtocol):
     current_message: Message
     additional_response_payload: Optional[list[bytes]] = None
 
+    # Maximum number of queued messages of one socket to handle before polling again.
+    drain_budget: int = 16
+
     def __init__(
         self,
         name: str,
@@ -86,6 +89,7 @@ class MessageHandler(BaseCommunicator, ExtendedComponentProtocol):
         self.name = name
         self._namespace: Union[str, None] = None
         self._full_name: str = name
+        self._full_name_bytes: bytes = name.encode()
         self.rpc = RPCServer(title=name)
         self.rpc_generator = RPCGenerator()
         self.register_rpc_methods()
@@ -110,6 +114,7 @@ class MessageHandler(BaseCommunicator, ExtendedComponentProtocol):
 
     def set_full_name(self, full_name: str) -> None:
         self._full_name = full_name
+        self._full_name_bytes = full_name.encode()
         self.rpc.title = full_name
         self.log_handler.full_name = full_name
 
@@ -117,6 +122,11 @@ class MessageHandler(BaseCommunicator, ExtendedComponentProtocol):
     def full_name(self) -> str:
         return self._full_name
 
+    @property
+    def full_name_bytes(self) -> bytes:
+        """The encoded :attr:`full_name`."""
+        return self._full_name_bytes
+
     def setup_logging(self, log):
         if log is None:
             log = logging.getLogger("__main__")
@@ -220,6 +230,20 @@ class MessageHandler(BaseCommunicator, ExtendedComponentProtocol):
         self.register_rpc_method(self.pong)
 
     # Base communication
+    def _send_socket_message(self, message: Message) -> None:
+        super()._send_socket_message(message=message)
+        self._postpone_heartbeat()
+
+    def _postpone_heartbeat(self) -> None:
+        """Postpone the next heartbeat, as any sent message serves as a heartbeat."""
+        self.next_beat = time.perf_counter() + heartbeat_interval
+
+    def send_message(self, message: Message) -> None:
+        """Send a message, supplying sender information."""
+        if not message.sender:
+            message.sender = self._full_name_bytes
+        super().send_message(message=message)
+
     def send(
         self,
         receiver: Union[bytes, str],
@@ -276,14 +300,22 @@ class MessageHandler(BaseCommunicator, ExtendedComponentProtocol):
         :param waiting_time: Timeout of the poller in ms.
         """
         socks = dict(poller.poll(waiting_time))
-        if self.socket in socks:
-            self.read_and_handle_message()
-            del socks[self.socket]
+        if socks.pop(self.socket, None):
+            self._handle_queued_messages(self.socket, self.read_and_handle_message)
         elif (now := time.perf_counter()) > self.next_beat:
             self.heartbeat()
             self.next_beat = now + heartbeat_interval
         return socks
 
+    def _handle_queued_messages(self, socket: zmq.Socket, read: Callable[[], None]) -> None:
+        """Call `read` for up to :attr:`drain_budget` messages queued at the polled `socket`."""
+        for _ in range(self.drain_budget):
+            read()
+            # Unlike `socket.poll`, reading the events does not create a new poller.
+            events = cast(int, socket.getsockopt(zmq.EVENTS))
+            if not events & zmq.POLLIN:
+                break
+
     def _listen_close(self, waiting_time: Optional[int] = None) -> None:
         """Close the listening loop."""
         self.log.info(f"Stop listen as '{self.name}'.")
@@ -293,15 +325,35 @@ class MessageHandler(BaseCommunicator, ExtendedComponentProtocol):
     def read_and_handle_message(self) -> None:
         """Interpret incoming message, which have not been requested."""
         try:
-            message = self.read_message(timeout=0)
+            message = self._read_unrequested_message()
         except (TimeoutError, JSONRPCError):
-            # only responses / errors arrived.
             return
-        self.log.debug(f"Handling message {message}")
+        if message is None:
+            return  # only a response arrived, which is stored in the buffer
+        self.log.debug("Handling message %s", message)
         if not message.payload:
             return  # no payload, that means just a heartbeat
         self.handle_message(message=message)
 
+    def _read_unrequested_message(self) -> Optional[Message]:
+        """Return the next free message, storing a requested socket message in the buffer.
+
+        Unlike :meth:`read_message`, it does not raise an error for a requested message.
+        """
+        message = self.message_buffer.retrieve_message()
+        if message is None:
+            try:
+                # A non-blocking read does not create a poller, unlike `socket.poll`.
+                frames = self.socket.recv_multipart(zmq.NOBLOCK)
+            except zmq.Again:
+                raise TimeoutError("Reading timed out")
+            message = Message.from_frames(*frames)
+            self.check_for_not_signed_in_error(message=message)
+            if self.message_buffer.is_conversation_id_requested(message.conversation_id):
+                self.message_buffer.add_message(message)
+                return None
+        return message
+
     def handle_message(self, message: Message) -> None:
         if message.header_elements.message_type == MessageTypes.JSON:
             self.handle_json_message(message=message)
@@ -331,7 +383,7 @@ class MessageHandler(BaseCommunicator, ExtendedComponentProtocol):
     def process_json_message(self, message: Message) -> Message:
         self.current_message = message
         self.additional_response_payload = None
-        self.log.info(f"Handling commands of {message}.")
+        self.log.info("Handling commands of %s.", message)
         reply = self.rpc.process_request(message.payload[0])
         response = Message(
             message.sender,
@@ -359,7 +411,9 @@ class MessageHandler(BaseCommunicator, ExtendedComponentProtocol):
     def set_log_level(self, level: str) -> None:
         """Set the log level."""
         plevel = PythonLogLevels[level]
-        self.root_logger.setLevel(plevel)
+        # Setting a level clears the level caches of all loggers, skip it if nothing changes.
+        if self.root_logger.level != plevel:
+            self.root_logger.setLevel(plevel)
 
     def shut_down(self) -> None:
         self.stop_event.set()
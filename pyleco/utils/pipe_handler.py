@@ -24,8 +24,8 @@
 
 from __future__ import annotations
 from enum import Enum
-from threading import get_ident, Condition
-from typing import Any, Callable, Optional, Union
+from threading import get_ident, Condition, Lock
+from typing import Any, Callable, Iterable, Optional, Union
 from warnings import warn
 
 import zmq
@@ -57,14 +57,18 @@ class LockedMessageBuffer(MessageBuffer):
     The main application thread uses :meth:`retrieve_message` to get the response message with a
     specific conversation_id.
     If the response is in the buffer, it is returned immediately.
-    If the response is not yet in the buffer, it waits until a new message is added to the buffer to
-    check, whether that message fits the conversation_id.
-    This is repeated until the suiting response is found or a limit is reached.
+    If the response is not yet in the buffer, it waits until a message with that conversation_id is
+    added to the buffer or a limit is reached.
+    Only the thread waiting for that conversation_id is woken up.
     """
 
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
-        self._buffer_lock = Condition()
+        self._buffer_lock = Lock()
+        # Conditions of the threads waiting for a message, by conversation_id
+        self._conditions: dict[bytes, Condition] = {}
+        # Number of threads waiting on each of these conditions
+        self._waiters: dict[bytes, int] = {}
 
     def add_conversation_id(self, conversation_id: bytes) -> None:
         """Add the conversation_id of a sent message in order to buffer the response."""
@@ -80,7 +84,9 @@ class LockedMessageBuffer(MessageBuffer):
         """Add a message to the buffer."""
         with self._buffer_lock:
             super().add_message(message)
-            self._buffer_lock.notify_all()
+            condition = self._conditions.get(message.conversation_id)
+            if condition is not None:
+                condition.notify_all()
 
     def add_response_message(self, message: Message) -> bool:
         """Add a message to the buffer, if it is a requested response.
@@ -118,9 +124,19 @@ class LockedMessageBuffer(MessageBuffer):
         :param timeout: Timeout in seconds.
         """
         with self._buffer_lock:
-            result = self._buffer_lock.wait_for(
-                self._predicate_generator(conversation_id=conversation_id),
-                timeout=timeout)
+            condition = self._conditions.get(conversation_id)
+            if condition is None:
+                condition = self._conditions[conversation_id] = Condition(self._buffer_lock)
+            self._waiters[conversation_id] = self._waiters.get(conversation_id, 0) + 1
+            try:
+                result = condition.wait_for(
+                    self._predicate_generator(conversation_id=conversation_id),
+                    timeout=timeout)
+            finally:
+                self._waiters[conversation_id] -= 1
+                if self._waiters[conversation_id] <= 0:
+                    self._waiters.pop(conversation_id, None)
+                    self._conditions.pop(conversation_id, None)
             if result:
                 return result
         # No result found:
@@ -178,7 +194,7 @@ class CommunicatorPipe(CommunicatorProtocol, SubscriberProtocol):
 
     def send_message(self, message: Message) -> None:
         if not message.sender:
-            message.sender = self.full_name.encode()
+            message.sender = self.handler.full_name_bytes
         self._send_pipe_message(PipeCommands.SEND, *message.to_frames())
 
     def read_message(self, conversation_id: Optional[bytes], timeout: Optional[float] = None
@@ -208,9 +224,21 @@ class CommunicatorPipe(CommunicatorProtocol, SubscriberProtocol):
     def subscribe_single(self, topic: bytes) -> None:
         self._send_pipe_message(PipeCommands.SUBSCRIBE, topic)
 
+    def subscribe(self, topics: Union[str, Iterable[str]]) -> None:
+        """Subscribe to a topic or list of topics with a single pipe message."""
+        if isinstance(topics, str):
+            topics = (topics,)
+        self._send_pipe_message(PipeCommands.SUBSCRIBE, *(topic.encode() for topic in topics))
+
     def unsubscribe_single(self, topic: bytes) -> None:
         self._send_pipe_message(PipeCommands.UNSUBSCRIBE, topic)
 
+    def unsubscribe(self, topics: Union[str, Iterable[str]]) -> None:
+        """Unsubscribe from a topic or list of topics with a single pipe message."""
+        if isinstance(topics, str):
+            topics = (topics,)
+        self._send_pipe_message(PipeCommands.UNSUBSCRIBE, *(topic.encode() for topic in topics))
+
     def unsubscribe_all(self) -> None:
         self._send_pipe_message(PipeCommands.UNSUBSCRIBE_ALL)
 
@@ -260,6 +288,16 @@ class PipeHandler(ExtendedMessageHandler):
         self.pipe_port = self.internal_pipe.bind_to_random_port("inproc://listenerPipe",
                                                                 min_port=12345)
         self._communicators = {}
+        # Dispatch table of the pipe commands, the raw command frame is a valid key.
+        self._pipe_commands: dict[bytes, Callable[[list[bytes]], None]] = {
+            PipeCommands.SEND: lambda msg: self._send_frames(frames=msg[1:]),
+            PipeCommands.LOCAL_COMMAND: lambda msg: self.handle_local_request(
+                conversation_id=msg[1], rpc=msg[2]),
+            PipeCommands.SUBSCRIBE: self._handle_pipe_subscribe,
+            PipeCommands.UNSUBSCRIBE: self._handle_pipe_unsubscribe,
+            PipeCommands.UNSUBSCRIBE_ALL: lambda msg: self.unsubscribe_all(),
+            PipeCommands.RENAME: lambda msg: self.rename_handler(msg[1].decode()),
+        }
 
     def setup_message_buffer(self) -> None:
         self.message_buffer = LockedMessageBuffer()
@@ -293,9 +331,8 @@ class PipeHandler(ExtendedMessageHandler):
     def _listen_loop_element(self, poller: zmq.Poller, waiting_time: Optional[int]
                              ) -> dict[zmq.Socket, int]:
         socks = super()._listen_loop_element(poller=poller, waiting_time=waiting_time)
-        if self.internal_pipe in socks:
-            self.read_and_handle_pipe_message()
-            del socks[self.internal_pipe]
+        if socks.pop(self.internal_pipe, None):
+            self._handle_queued_messages(self.internal_pipe, self.read_and_handle_pipe_message)
         return socks
 
     def read_and_handle_pipe_message(self) -> None:
@@ -303,21 +340,20 @@ class PipeHandler(ExtendedMessageHandler):
         self.handle_pipe_message(msg)
 
     def handle_pipe_message(self, msg: list[bytes]) -> None:
-        cmd = msg[0]
-        if cmd == PipeCommands.SUBSCRIBE:
-            self.subscribe_single(topic=msg[1])
-        elif cmd == PipeCommands.UNSUBSCRIBE:
-            self.unsubscribe_single(topic=msg[1])
-        elif cmd == PipeCommands.UNSUBSCRIBE_ALL:
-            self.unsubscribe_all()
-        elif cmd == PipeCommands.SEND:
-            self._send_frames(frames=msg[1:])
-        elif cmd == PipeCommands.RENAME:
-            self.rename_handler(msg[1].decode())
-        elif cmd == PipeCommands.LOCAL_COMMAND:
-            self.handle_local_request(conversation_id=msg[1], rpc=msg[2])
+        try:
+            command = self._pipe_commands[msg[0]]
+        except KeyError:
+            self.log.debug("Received unknown '%s'.", msg)
         else:
-            self.log.debug(f"Received unknown '{msg}'.")
+            command(msg)
+
+    def _handle_pipe_subscribe(self, msg: list[bytes]) -> None:
+        for topic in msg[1:]:
+            self.subscribe_single(topic=topic)
+
+    def _handle_pipe_unsubscribe(self, msg: list[bytes]) -> None:
+        for topic in msg[1:]:
+            self.unsubscribe_single(topic=topic)
 
     def rename_handler(self, name):
         self.sign_out()
@@ -328,8 +364,9 @@ class PipeHandler(ExtendedMessageHandler):
     # Control protocol
     def _send_frames(self, frames: list[bytes]) -> None:
         """Send frames over the connection."""
-        self.log.debug(f"Sending {frames}")
+        self.log.debug("Sending %s", frames)
         self.socket.send_multipart(frames)
+        self._postpone_heartbeat()
 
     # Local messages
     def handle_local_request(self, conversation_id: bytes, rpc: bytes) -> None:
@@ -110,10 +110,12 @@ class QtListener(Listener):
         super().__init__(name=name, host=host, **kwargs)
         self.signals = ListenerSignals()
 
-    def _listen(self, name: str, stop_event, coordinator_host: str, coordinator_port: int,
-                data_host: str, data_port: int) -> None:
-        self.message_handler = QtPipeHandler(name, signals=self.signals,
-                                             host=coordinator_host, port=coordinator_port,
-                                             data_host=data_host, data_port=data_port,)
-        self.message_handler.register_on_name_change_method(self.signals.name_changed.emit)
-        self.message_handler.listen(stop_event=stop_event)
+    def _create_message_handler(self, name: str, coordinator_host: str, coordinator_port: int,
+                                data_host: str, data_port: int) -> QtPipeHandler:
+        message_handler = QtPipeHandler(name, signals=self.signals,
+                                        host=coordinator_host, port=coordinator_port,
+                                        data_host=data_host, data_port=data_port,
+                                        data_rcvhwm=self.data_rcvhwm,
+                                        io_threads=self.io_threads)
+        message_handler.register_on_name_change_method(self.signals.name_changed.emit)
+        return message_handler
@@ -142,3 +142,9 @@ class TestComparison:
 def test_repr():
     message = DataMessage.from_frames(b'topic', b'conversation_id;\x00', b'data')
     assert repr(message) == r"DataMessage.from_frames(b'topic', b'conversation_id;\x00', b'data')"
+
+
+def test_no_instance_dict():
+    message = DataMessage("topic")
+    with pytest.raises(AttributeError):
+        message.something = 5  # type: ignore
@@ -228,3 +228,8 @@ def test_repr_without_sender():
 
 def test_conversation_id_getter(message: Message):
     assert message.conversation_id == cid
+
+
+def test_no_instance_dict(message: Message):
+    with pytest.raises(AttributeError):
+        message.something = 5  # type: ignore
@@ -92,6 +92,10 @@ class Test_serialize:
         expected = b'{"some":"item","key":"value","5":[7,3.1]}'
         assert serialization.serialize_data(raw) == expected
 
+    def test_nan(self):
+        """Measurement data may contain NaN values, which have to be serializable."""
+        assert serialization.serialize_data([float("nan")]) == b"[NaN]"
+
 
 class Test_generate_conversation_id_is_UUIDv7:
     @pytest.fixture
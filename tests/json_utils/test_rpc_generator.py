@@ -26,7 +26,7 @@ from typing import Union
 
 import pytest
 
-from pyleco.json_utils.json_objects import ErrorResponse
+from pyleco.json_utils.json_objects import ErrorResponse, ParamsRequest, Request
 from pyleco.json_utils.errors import (JSONRPCError, NODE_UNKNOWN, NOT_SIGNED_IN, DUPLICATE_NAME,
                                       RECEIVER_UNKNOWN)
 
@@ -50,6 +50,24 @@ def test_build_request_str(generator: RPCGenerator, method: str, args: tuple, kw
     assert generator.build_request_str(method, *args, **kwargs) == result
 
 
+@pytest.mark.parametrize("method", ("meth", "with \"quotes\", commas", "ümlaut"))
+def test_build_request_str_equals_request_dump(generator: RPCGenerator, method: str):
+    generator.build_request_str("some_method")
+    assert generator.build_request_str(method) == Request(id=2, method=method).model_dump_json()
+
+
+@pytest.mark.parametrize("method", ("meth", "with \"params\":[]", "ümlaut"))
+@pytest.mark.parametrize("args, kwargs", (
+        ((5, "text", [1.5, None]), {}),
+        ((), {"kwarg": {"nested": [True]}}),
+        ((ErrorResponse(id=3, error=NOT_SIGNED_IN),), {}),
+))
+def test_build_request_str_with_params_equals_request_dump(
+        generator: RPCGenerator, method: str, args: tuple, kwargs: dict):
+    assert generator.build_request_str(method, *args, **kwargs) == ParamsRequest(
+        id=1, method=method, params=kwargs or list(args)).model_dump_json()
+
+
 def test_build_request_str_raises_error(generator: RPCGenerator):
     with pytest.raises(ValueError, match="same time"):
         generator.build_request_str("some_method", "argument", keyword="whatever")
@@ -175,12 +175,45 @@ def test_set_valuing_mode_last(data_logger: DataLogger):
     assert data_logger.last == data_logger.valuing
 
 
-def test_handle_subscription_message_calls_handle_data(data_logger: DataLogger):
+def test_handle_subscription_message_does_not_call_handle_data(data_logger: DataLogger):
+    """New style data messages are stored directly, unless a subclass overrides the hook."""
     data_logger.handle_subscription_data = MagicMock()  # type: ignore[method-assign]
     message = DataMessage(topic="N1.sender", data={'var': 5, 'test': 7.3})
     data_logger.handle_subscription_message(message)
-    data_logger.handle_subscription_data.assert_called_once_with({"N1.sender.var": 5,
-                                                                  "N1.sender.test": 7.3})
+    data_logger.handle_subscription_data.assert_not_called()
+    assert data_logger.tmp["N1.sender.var"] == [5]
+
+
+def test_handle_subscription_message_calls_overridden_handle_data():
+    class SubDataLogger(DataLogger):
+        def handle_subscription_data(self, data: dict) -> None:
+            self.received = data
+            super().handle_subscription_data(data)
+
+    data_logger = SubDataLogger(context=FakeContext())
+    data_logger.subscriber.subscribe = MagicMock()  # type: ignore[method-assign]
+    data_logger.start_collecting(variables=["N1.sender.var"], trigger_type=TriggerTypes.VARIABLE,
+                                 trigger_variable="N1.sender.other")
+    message = DataMessage(topic="N1.sender", data={'var': 5, 'test': 7.3})
+    data_logger.handle_subscription_message(message)
+    assert data_logger.received == {"N1.sender.var": 5, "N1.sender.test": 7.3}
+    assert data_logger.tmp["N1.sender.var"] == [5]
+
+
+def test_handle_subscription_message_triggers(data_logger: DataLogger):
+    data_logger.trigger_type = TriggerTypes.VARIABLE
+    data_logger.trigger_variable = "N1.sender.var"
+    message = DataMessage(topic="N1.sender", data={'var': 5, 'test': 7.3})
+    data_logger.handle_subscription_message(message)
+    assert data_logger.lists["N1.sender.var"] == [5]
+
+
+def test_handle_subscription_message_does_not_trigger_for_other_sender(data_logger: DataLogger):
+    data_logger.trigger_type = TriggerTypes.VARIABLE
+    data_logger.trigger_variable = "N1.sender.var"
+    message = DataMessage(topic="N1.other", data={'var': 7.3})
+    data_logger.handle_subscription_message(message)
+    assert data_logger.lists["N1.sender.var"] == []
 
 
 def test_handle_subscription_message_adds_data_to_lists(data_logger: DataLogger):
@@ -189,6 +222,20 @@ def test_handle_subscription_message_adds_data_to_lists(data_logger: DataLogger)
     assert data_logger.tmp["N1.sender.var"] == [5.6]
 
 
+def test_handle_subscription_message_without_list(data_logger: DataLogger,
+                                                  caplog: pytest.LogCaptureFixture):
+    caplog.set_level(0)
+    message = DataMessage(topic="N1.sender", data={"not_present": 42})
+    data_logger.handle_subscription_message(message)
+    assert caplog.messages == ["Got value for 'N1.sender.not_present', but no list present."]
+
+
+def test_reset_data_storage_clears_topic_prefixes(data_logger: DataLogger):
+    data_logger.handle_subscription_message(DataMessage(topic="N1.sender", data={"var": 5}))
+    data_logger.reset_data_storage()
+    assert data_logger._topic_prefixes == {}
+
+
 def test_handle_subscription_message_handles_broken_message(data_logger: DataLogger,
                                                             caplog: pytest.LogCaptureFixture):
     message = DataMessage(topic="N1.sender", data="not a dict")
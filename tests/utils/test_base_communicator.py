@@ -346,7 +346,8 @@ class Test_read_message:
         # act
         communicator.read_message(conversation_id=cid0)
         assert communicator._r == socket_out  # type: ignore
-        assert communicator.message_buffer._messages == buffer_out
+        buffer = communicator.message_buffer
+        assert buffer._messages + list(buffer._responses.values()) == buffer_out
 
     def test_timeout_zero_works(self, communicator: FakeBaseCommunicator):
         communicator._r = [m1]  # type: ignore
@@ -85,3 +85,9 @@ def test_set_full_name(publisher: DataPublisher):
     new_full_name = "new full name"
     publisher.set_full_name(new_full_name)
     assert publisher.full_name == new_full_name
+
+
+def test_renamed_publisher_sends_with_new_name(publisher: DataPublisher):
+    publisher.full_name = "N1.new"
+    publisher(b"data")
+    assert publisher.socket._s[0][0] == b"N1.new"  # type: ignore
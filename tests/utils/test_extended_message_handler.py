@@ -24,9 +24,10 @@
 
 import json
 import pickle
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
+import zmq
 
 from pyleco.core.data_message import DataMessage
 from pyleco.test import FakeContext, FakeSocket
@@ -45,6 +46,19 @@ def handler():
     return handler
 
 
+def test_io_threads_used_for_default_context():
+    with patch("pyleco.utils.extended_message_handler.zmq.Context.instance") as instance:
+        instance.return_value = FakeContext()
+        ExtendedMessageHandler(name="handler", io_threads=3)
+    instance.assert_any_call(io_threads=3)
+
+
+def test_data_rcvhwm_is_set():
+    handler = ExtendedMessageHandler(name="handler", context=FakeContext(),  # type: ignore
+                                     data_rcvhwm=50)
+    assert handler.subscriber.getsockopt(zmq.RCVHWM) == 50
+
+
 def test_read_subscription_message_calls_handle(handler: ExtendedMessageHandler):
     message = DataMessage("", data="[]")
     handler.subscriber._r = [message.to_frames()]  # type: ignore
@@ -71,7 +85,7 @@ def test_read_subscription_message_calls_handle_legacy(handler: ExtendedMessageH
 def test_subscribe_single(handler: ExtendedMessageHandler):
     handler.subscribe_single(b"topic")
     assert handler.subscriber._subscriptions == [b"topic"]  # type: ignore
-    assert handler._subscriptions == [b"topic"]
+    assert handler._subscriptions == {b"topic"}
 
 
 def test_subscribe_single_again(handler: ExtendedMessageHandler, caplog: pytest.LogCaptureFixture):
@@ -84,9 +98,9 @@ def test_subscribe_single_again(handler: ExtendedMessageHandler, caplog: pytest.
 
 
 @pytest.mark.parametrize("topics, result", (
-        ("topic", [b"topic"]),  # single string
-        (["topic1", "topic2"], [b"topic1", b"topic2"]),  # list of strings
-        (("topic1", "topic2"), [b"topic1", b"topic2"]),  # tuple of strings
+        ("topic", {b"topic"}),  # single string
+        (["topic1", "topic2"], {b"topic1", b"topic2"}),  # list of strings
+        (("topic1", "topic2"), {b"topic1", b"topic2"}),  # tuple of strings
 ))
 def test_subscribe(handler: ExtendedMessageHandler, topics, result):
     handler.subscribe(topics)
@@ -94,28 +108,28 @@ def test_subscribe(handler: ExtendedMessageHandler, topics, result):
 
 
 def test_unsubscribe_single(handler: ExtendedMessageHandler):
-    handler._subscriptions = [b"topic"]
+    handler._subscriptions = {b"topic"}
     handler.subscriber._subscriptions = [b"topic"]  # type: ignore
     handler.unsubscribe_single(b"topic")
-    assert handler._subscriptions == []
+    assert handler._subscriptions == set()
     assert handler.subscriber._subscriptions == []  # type: ignore
 
 
 @pytest.mark.parametrize("topics, result", (
-        ("topic", [b"topic"]),  # single string
-        (["topic1", "topic2"], [b"topic1", b"topic2"]),  # list of strings
-        (("topic1", "topic2"), [b"topic1", b"topic2"]),  # tuple of strings
+        ("topic", {b"topic"}),  # single string
+        (["topic1", "topic2"], {b"topic1", b"topic2"}),  # list of strings
+        (("topic1", "topic2"), {b"topic1", b"topic2"}),  # tuple of strings
 ))
 def test_unsubscribe(handler: ExtendedMessageHandler, topics, result):
     handler._subscriptions = result
     handler.unsubscribe(topics)
-    assert handler._subscriptions == []
+    assert handler._subscriptions == set()
 
 
 def test_unsubscribe_all(handler: ExtendedMessageHandler):
-    handler._subscriptions = [b"topic1", b"topic2"]
+    handler._subscriptions = {b"topic1", b"topic2"}
     handler.unsubscribe_all()
-    assert handler._subscriptions == []
+    assert handler._subscriptions == set()
 
 
 class Test_handle_full_legacy_subscription_message:
@@ -22,6 +22,10 @@
 # THE SOFTWARE.
 #
 
+import logging
+from threading import Event
+from unittest.mock import MagicMock
+
 import pytest
 
 from pyleco.test import FakeCommunicator
@@ -41,6 +45,35 @@ def test_communicator_name_is_returned(listener: Listener):
     assert listener.name == "N.Pipe"
 
 
+def test_listen_passes_handler_options(monkeypatch: pytest.MonkeyPatch):
+    pipe_handler = MagicMock()
+    monkeypatch.setattr("pyleco.utils.listener.PipeHandler", pipe_handler)
+    listener = Listener(name="test", data_rcvhwm=5000, io_threads=2)
+    stop_event = Event()
+    listener._listen("test", stop_event, "localhost", 12300, "localhost", 11100)
+    assert pipe_handler.call_args.kwargs["data_rcvhwm"] == 5000
+    assert pipe_handler.call_args.kwargs["io_threads"] == 2
+    assert listener._handler_ready.is_set()
+    pipe_handler.return_value.listen.assert_called_once_with(stop_event=stop_event)
+
+
+def test_start_listen_with_overridden_listen():
+    handler = MagicMock()
+    handler.log_handler = logging.NullHandler()
+
+    class LegacyListener(Listener):
+        def _listen(self, name: str, stop_event: Event, *args) -> None:  # type: ignore[override]
+            self.message_handler = handler
+            stop_event.wait()
+
+    listener = LegacyListener(name="test")
+    listener.start_listen()
+    try:
+        assert listener.communicator == handler.get_communicator.return_value
+    finally:
+        listener.stop_listen()
+
+
 class Test_communicator_closed_at_stopped_listener():
     @pytest.fixture(scope="class")
     def communicator(self) -> CommunicatorPipe:
@@ -203,6 +203,9 @@ class Test_finish_sign_in:
     def test_full_name(self, handler_fsi: MessageHandler):
         assert handler_fsi.full_name == "N5.handler"
 
+    def test_full_name_bytes(self, handler_fsi: MessageHandler):
+        assert handler_fsi.full_name_bytes == b"N5.handler"
+
     def test_log_message(self, handler_fsi: MessageHandler, caplog: pytest.LogCaptureFixture):
         assert caplog.get_records("setup")[-1].message == ("Signed in to Node 'N5'.")
 
@@ -251,6 +254,13 @@ def test_send_with_sender(handler: MessageHandler):
                                   b'[["TEST"]]']]
 
 
+def test_send_after_renaming(handler: MessageHandler):
+    handler.set_full_name("N3.new")
+    handler.send("N2.CB", conversation_id=cid, message_id=b"sen", data=[["TEST"]],
+                 message_type=MessageTypes.JSON)
+    assert handler.socket._s[0][2] == b"N3.new"  # type: ignore
+
+
 def test_send_message_raises_error(handler: MessageHandler, caplog: pytest.LogCaptureFixture):
     handler.send(receiver=remote_name, header=b"header", conversation_id=b"12345")
     assert caplog.messages[-1].startswith("Composing message with")
@@ -320,7 +330,8 @@ class Test_read_message:
         # act
         handler.read_message(conversation_id=cid0)
         assert handler.socket._r == [m.to_frames() for m in socket_out]  # type: ignore
-        assert handler.message_buffer._messages == buffer_out
+        buffer = handler.message_buffer
+        assert buffer._messages + list(buffer._responses.values()) == buffer_out
 
     def test_timeout_zero_works(self, handler: MessageHandler):
         handler.socket._r = [self.m1.to_frames()]  # type: ignore
@@ -366,6 +377,24 @@ class Test_read_and_handle_message:
         handler.read_and_handle_message()
         # assert that no error is raised.
 
+    def test_requested_message_is_buffered(self, handler: MessageHandler):
+        handler.handle_message = MagicMock()  # type: ignore
+        handler.message_buffer.add_conversation_id(cid)
+        message = Message(receiver=handler_name, sender=remote_name, conversation_id=cid)
+        handler.socket._r = [message.to_frames()]  # type: ignore
+        handler.read_and_handle_message()
+        handler.handle_message.assert_not_called()
+        assert handler.message_buffer.retrieve_message(cid) == message
+
+    def test_read_does_not_poll(self, handler: MessageHandler):
+        handler.handle_message = MagicMock()  # type: ignore
+        handler.socket.poll = MagicMock()  # type: ignore[method-assign]
+        handler.socket._r = [  # type: ignore
+            Message(receiver=handler_name, sender=remote_name, data=b"x").to_frames()]
+        handler.read_and_handle_message()
+        handler.socket.poll.assert_not_called()  # type: ignore[attr-defined]
+        handler.handle_message.assert_called_once()
+
     def test_handle_message_ignores_heartbeats(self, handler: MessageHandler):
         handler.handle_message = MagicMock()  # type: ignore
         # empty message of heartbeat
@@ -700,6 +729,11 @@ class Test_listen:
         handler_l._listen_loop_element(poller=FakePoller(), waiting_time=0)  # type: ignore
         assert handler_l.next_beat == float("inf")
 
+    def test_sending_postpones_heartbeat(self, handler_l: MessageHandler):
+        handler_l.next_beat = 0
+        handler_l.send_message(Message("N1.CB"))
+        assert handler_l.next_beat > 0
+
     def test_KeyboardInterrupt_in_loop(self, handler: MessageHandler):
         def raise_error(poller, waiting_time):
             raise KeyboardInterrupt
@@ -745,6 +779,15 @@ def test_set_log_level(handler: MessageHandler):
     assert handler.root_logger.level == 40  # logging.ERROR
 
 
+def test_set_log_level_unchanged_does_not_set_level(handler: MessageHandler,
+                                                    monkeypatch: pytest.MonkeyPatch):
+    handler.root_logger.setLevel(logging.ERROR)
+    set_level = MagicMock()
+    monkeypatch.setattr(handler.root_logger, "setLevel", set_level)
+    handler.set_log_level(LogLevels.ERROR)
+    set_level.assert_not_called()
+
+
 def test_shutdown(handler: MessageHandler):
     handler.stop_event = SimpleEvent()
     handler.shut_down()
@@ -22,13 +22,16 @@
 # THE SOFTWARE.
 #
 
+from __future__ import annotations
+from threading import Thread, Timer
 from unittest.mock import MagicMock
 
 import pytest
 import zmq
 
+from pyleco.core.data_message import DataMessage
 from pyleco.core.message import Message
-from pyleco.test import FakeContext
+from pyleco.test import FakeContext, FakePoller
 
 from pyleco.utils.pipe_handler import LockedMessageBuffer, PipeHandler, CommunicatorPipe,\
     PipeCommands
@@ -70,7 +73,17 @@ class Test_add_response_message_successful:
         assert len(message_buffer_added) == 1
 
     def test_msg_in_buffer(self, message_buffer_added: LockedMessageBuffer):
-        assert message_buffer_added._messages == [msg]
+        assert message_buffer_added._responses == {cid: msg}
+
+    def test_retrieve_msg(self, message_buffer_added: LockedMessageBuffer):
+        assert message_buffer_added.retrieve_message(cid) == msg
+        assert len(message_buffer_added) == 0
+        assert not message_buffer_added.is_conversation_id_requested(cid)
+
+    def test_msg_is_free_after_removing_conversation_id(
+            self, message_buffer_added: LockedMessageBuffer):
+        message_buffer_added.remove_conversation_id(cid)
+        assert message_buffer_added.retrieve_message() == msg
 
 
 class Test_check_message_in_buffer:
@@ -119,6 +132,30 @@ def test_retrieve_message_fail(message_buffer: LockedMessageBuffer, buffer):
         message_buffer.wait_for_message(conversation_id=cid, timeout=0.01)
 
 
+def test_wait_for_message_added_by_other_thread():
+    message_buffer = LockedMessageBuffer()
+    message_buffer.add_conversation_id(cid)
+    timer = Timer(0.01, message_buffer.add_message, args=(msg,))
+    timer.start()
+    assert message_buffer.wait_for_message(cid) == msg
+    assert message_buffer._conditions == {}
+
+
+def test_two_threads_wait_for_the_same_message():
+    message_buffer = LockedMessageBuffer()
+    message_buffer.add_conversation_id(cid)
+    results = []
+    waiter = Thread(target=lambda: results.append(message_buffer.wait_for_message(cid)))
+    waiter.start()
+    with pytest.raises(TimeoutError):
+        message_buffer.wait_for_message(cid, timeout=0.01)
+    message_buffer.add_message(msg)
+    waiter.join(1)
+    assert results == [msg]
+    assert message_buffer._conditions == {}
+    assert message_buffer._waiters == {}
+
+
 @pytest.mark.parametrize("length", (1, 3, 7))
 def test_length_of_buffer(message_buffer: LockedMessageBuffer, length: int):
     message_buffer._messages = length * [msg]
@@ -176,6 +213,37 @@ def test_close_closes_all_communicators(
     assert communicator.socket.closed is True
 
 
+class Test_listen_loop_element_drains_socket:
+    """Queued messages of each polled socket are handled up to the drain budget."""
+
+    @pytest.fixture(params=(
+        ("socket", Message("handler", "N1.CB", data="[]").to_frames(), "handle_message"),
+        ("subscriber", DataMessage("", data="[]").to_frames(), "handle_subscription_message"),
+        ("internal_pipe", [b"unknown"], "handle_pipe_message"),
+    ), ids=("socket", "subscriber", "internal_pipe"))
+    def handling(self, pipe_handler: PipeHandler, request) -> tuple[FakePoller, MagicMock]:
+        socket_name, frames, method_name = request.param
+        socket = getattr(pipe_handler, socket_name)
+        socket._r = [frames for _ in range(3)]
+        method = MagicMock()
+        setattr(pipe_handler, method_name, method)
+        pipe_handler.next_beat = float("inf")
+        poller = FakePoller()
+        poller.register(socket)
+        return poller, method
+
+    def test_all_queued_messages_handled(self, pipe_handler: PipeHandler, handling):
+        poller, method = handling
+        pipe_handler._listen_loop_element(poller=poller, waiting_time=0)  # type: ignore
+        assert method.call_count == 3
+
+    def test_handled_messages_limited(self, pipe_handler: PipeHandler, handling):
+        poller, method = handling
+        pipe_handler.drain_budget = 2
+        pipe_handler._listen_loop_element(poller=poller, waiting_time=0)  # type: ignore
+        assert method.call_count == 2
+
+
 class Test_PipeHandler_read_message:
     def test_handle_response(self, pipe_handler: PipeHandler):
         message = Message("rec", "send")
@@ -289,6 +357,30 @@ def test_communicator_subscribe(pipe_handler_pipe: PipeHandler, communicator: Co
     pipe_handler_pipe.subscribe_single.assert_called_once_with(topic=b"topic")
 
 
+def test_communicator_subscribe_several_topics_at_once(pipe_handler_pipe: PipeHandler,
+                                                     communicator: CommunicatorPipe):
+    pipe_handler_pipe.subscribe_single = MagicMock()  # type: ignore[method-assign]
+    # act
+    communicator.subscribe(["topic1", "topic2"])
+    pipe_handler_pipe.read_and_handle_pipe_message()
+    # assert
+    assert pipe_handler_pipe.internal_pipe.poll(0) == 0  # a single pipe message
+    assert pipe_handler_pipe.subscribe_single.call_count == 2
+    pipe_handler_pipe.subscribe_single.assert_called_with(topic=b"topic2")
+
+
+def test_communicator_unsubscribe_several_topics_at_once(pipe_handler_pipe: PipeHandler,
+                                                       communicator: CommunicatorPipe):
+    pipe_handler_pipe.unsubscribe_single = MagicMock()  # type: ignore[method-assign]
+    # act
+    communicator.unsubscribe(["topic1", "topic2"])
+    pipe_handler_pipe.read_and_handle_pipe_message()
+    # assert
+    assert pipe_handler_pipe.internal_pipe.poll(0) == 0  # a single pipe message
+    assert pipe_handler_pipe.unsubscribe_single.call_count == 2
+    pipe_handler_pipe.unsubscribe_single.assert_called_with(topic=b"topic2")
+
+
 def test_communicator_unsubscribe(pipe_handler_pipe: PipeHandler, communicator: CommunicatorPipe):
     pipe_handler_pipe.unsubscribe_single = MagicMock()  # type: ignore[method-assign]
     # act
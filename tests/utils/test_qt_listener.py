@@ -22,6 +22,9 @@
 # THE SOFTWARE.
 #
 
+from threading import Event
+from unittest.mock import MagicMock
+
 import pytest
 
 from pyleco.test import FakeCommunicator, FakeContext
@@ -60,6 +63,16 @@ def qt_handler(signal) -> QtPipeHandler:
     return handler
 
 
+def test_listen_passes_handler_options(monkeypatch: pytest.MonkeyPatch):
+    qt_pipe_handler = MagicMock()
+    monkeypatch.setattr("pyleco.utils.qt_listener.QtPipeHandler", qt_pipe_handler)
+    qt_listener = QtListener(name="test", data_rcvhwm=5000, io_threads=2)
+    qt_listener._listen("test", Event(), "localhost", 12300, "localhost", 11100)
+    assert qt_pipe_handler.call_args.kwargs["data_rcvhwm"] == 5000
+    assert qt_pipe_handler.call_args.kwargs["io_threads"] == 2
+    assert qt_listener._handler_ready.is_set()
+
+
 class Test_handle_message:
     def test_handle_valid_jsonrpc(self, qt_handler: QtPipeHandler):
         msg = Message("N.Pipe", "sender",